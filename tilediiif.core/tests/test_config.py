@@ -1,3 +1,4 @@
+import os
 import textwrap
 from io import StringIO
 from pathlib import Path
@@ -17,6 +18,7 @@ from tilediiif.core.config.core import (
     EmptyEnvar,
     EnvironmentConfigMixin,
     _parse_function_attrs,
+    load_toml,
     normalise_variant,
     simple_default_factory,
 )
@@ -25,7 +27,7 @@ from tilediiif.core.config.parsing import parse_bool_strict, simple_parser
 from tilediiif.core.config.validation import isinstance_validator, iterable_validator
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def config_cls_a():
     class ConfigA(BaseConfig):
         property_definitions = [
@@ -36,7 +38,7 @@ def config_cls_a():
     return ConfigA
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def config_cls_b():
     class ConfigB(BaseConfig):
         property_definitions = [
@@ -223,6 +225,13 @@ def test_config_classes_marked_as_abstract_dont_need_attributes():
         is_abstract_config_cls = True
 
 
+def test_config_classes_can_be_marked_as_abstract_with_class_keyword():
+    class EmptyConfig(Config, abstract=True):
+        pass
+
+    assert EmptyConfig.is_abstract_config_cls is True
+
+
 def test_config_property_default_value():
     class ExampleConfig(BaseConfig):
         property_definitions = [ConfigProperty("foo", default=42)]
@@ -444,7 +453,7 @@ def test_config_values_are_normalised():
     assert config.foo == {"a", "b"}
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def example_config_cls():
     class ExampleConfig(Config):
         json_schema = {
@@ -524,6 +533,21 @@ def test_config_from_json_with_true_as_schema_accepts_any_json():
     assert ExampleConfig.from_json({"abc": {"def": 42}}).foo == 42
 
 
+def test_config_from_json_uses_reassigned_json_schema():
+    class ExampleConfig(JSONConfigMixin, BaseConfig):
+        json_schema = True
+        property_definitions = [ConfigProperty("foo", json_path="foo")]
+
+    assert ExampleConfig.from_json({"foo": 1}).foo == 1
+
+    ExampleConfig.json_schema = {"type": "object", "required": ["bar"]}
+    with pytest.raises(ConfigError) as exc_info:
+        ExampleConfig.from_json({"foo": 1})
+    assert str(exc_info.value).startswith(
+        "Configuration data is invalid: 'bar' is a required property"
+    )
+
+
 def test_config_from_json(example_config_cls):
     config = example_config_cls.from_json(
         {
@@ -555,41 +579,86 @@ def test_config_from_json_validates_data_against_schema(example_config_cls):
     )
 
 
-def test_config_from_toml_file(example_config_cls):
-    toml_file = StringIO(
-        textwrap.dedent(
-            """
-        [config]
-        foo = 42
-        bar = "abc,def"
-        is_baz = true
-
-        [ignored-other-stuff]
-        foo = "bar"
+VALID_TOML = textwrap.dedent(
     """
-        )
-    )
+    [config]
+    foo = 42
+    bar = "abc,def"
+    is_baz = true
+
+    [ignored-other-stuff]
+    foo = "bar"
+"""
+)
 
-    config = example_config_cls.from_toml_file(toml_file)
+INVALID_TOML = textwrap.dedent(
+    """
+    [config]
+    foo = 42
+    not-allowed = "foo"
+"""
+)
+
+
+def test_config_classes_can_opt_in_to_having_no_instance_dict():
+    class SlottedConfig(Config):
+        __slots__ = ()
+        json_schema = None
+        property_definitions = [ConfigProperty("foo")]
+
+    config = SlottedConfig(foo=1)
+    assert not hasattr(config, "__dict__")
+
+    with pytest.raises(AttributeError):
+        config.not_a_property = 1
+
+
+def test_config_subclasses_can_set_instance_attributes(example_config_cls):
+    config = example_config_cls(foo=1)
+    config.not_a_property = 1
+    assert config.not_a_property == 1
+
+
+def test_config_from_toml_file(example_config_cls):
+    config = example_config_cls.from_toml_file(StringIO(VALID_TOML))
     assert config.foo == 42
     assert config.bar == ["abc", "def"]
     assert config.is_baz is True
     assert config.boz is None
 
 
-def test_config_from_toml_file_validates_data_against_schema(example_config_cls):
-    toml_file = StringIO(
-        textwrap.dedent(
-            """
-        [config]
-        foo = 42
-        not-allowed = "foo"
-    """
-        )
-    )
+def test_load_toml_caches_files_until_they_change(tmp_path):
+    path = tmp_path / "config.toml"
+    path.write_text("a = 1\n")
+
+    first = load_toml(path)
+    assert first == {"a": 1}
+    first["a"] = 2
+    # Mutating the result must not affect the cached value
+    assert load_toml(str(path)) == {"a": 1}
+
+    path.write_text("a = 10\n")
+    assert load_toml(path) == {"a": 10}
+
 
+def test_load_toml_cache_can_be_disabled(tmp_path, monkeypatch):
+    monkeypatch.setenv("TILEDIIIF_DISABLE_CONFIG_CACHE", "true")
+    path = tmp_path / "config.toml"
+    path.write_text("a = 1\n")
+    stat = path.stat()
+    assert load_toml(path) == {"a": 1}
+
+    # Same size and mtime, so only an uncached read sees the change
+    path.write_text("a = 2\n")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert load_toml(path) == {"a": 2}
+
+
+def test_config_from_toml_file_validates_data_against_schema(example_config_cls):
     with pytest.raises(ConfigError) as exc_info:
-        example_config_cls.from_toml_file(toml_file, name="invalid-toml-example")
+        example_config_cls.from_toml_file(
+            StringIO(INVALID_TOML), name="invalid-toml-example"
+        )
 
     assert str(exc_info.value).startswith(
         "Configuration data from invalid-toml-example is invalid: Additional "
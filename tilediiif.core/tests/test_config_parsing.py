@@ -38,6 +38,28 @@ def test_enum_list_parser():
 
     parser = enum_list_parser(Foo)
     assert parser("a,b,a") == [Foo.A, Foo.B, Foo.A]
+    assert parser("a, b") == [Foo.A, Foo.B]
+
+    with pytest.raises(ValueError) as exc_info:
+        parser("a,c")
+    assert str(exc_info.value).startswith("'c' is not a valid ")
+
+
+def test_enum_list_parser_accepts_a_function():
+    class Foo(enum.Enum):
+        A = "a"
+        B = "b"
+
+        @classmethod
+        def for_label(cls, label):
+            return cls[label.upper()]
+
+    parser = enum_list_parser(Foo.for_label)
+    assert parser("a,b,a") == [Foo.A, Foo.B, Foo.A]
+    assert parser("a, b") == [Foo.A, Foo.B]
+
+    with pytest.raises(KeyError):
+        parser("a,c")
 
 
 def test_parse_bool_strict():
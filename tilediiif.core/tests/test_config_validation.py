@@ -5,6 +5,7 @@ import pytest
 from tilediiif.core.config.core import ConfigValidationError
 from tilediiif.core.config.validation import (
     all_validator,
+    any_validator,
     in_validator,
     isinstance_validator,
     iterable_validator,
@@ -61,6 +62,50 @@ def test_all_validator():
     b.assert_called_once_with(sentinel)
 
 
+def test_all_validator_stops_at_first_failure():
+    a = MagicMock(side_effect=ConfigValidationError("a failed"))
+    b = MagicMock()
+    validator = all_validator(a, b)
+
+    with pytest.raises(ConfigValidationError) as exc_info:
+        validator(sentinel)
+    assert str(exc_info.value) == "a failed"
+    a.assert_called_once_with(sentinel)
+    b.assert_not_called()
+
+
+def test_any_validator_stops_at_first_success():
+    a = MagicMock(side_effect=ConfigValidationError("a failed"))
+    b = MagicMock()
+    c = MagicMock()
+    validator = any_validator(a, b, c)
+
+    validator(sentinel)
+    a.assert_called_once_with(sentinel)
+    b.assert_called_once_with(sentinel)
+    c.assert_not_called()
+
+
+def test_any_validator_reports_all_failures():
+    validator = any_validator(isinstance_validator(int), in_validator(("a", "b")))
+
+    validator(1)
+    validator("a")
+    with pytest.raises(ConfigValidationError) as exc_info:
+        validator("c")
+    assert (
+        str(exc_info.value)
+        == "all alternatives failed: expected int but got str: 'c'; "
+        "'c' is not in ('a', 'b')"
+    )
+
+
+def test_any_validator_requires_validators():
+    with pytest.raises(ValueError) as exc_info:
+        any_validator()
+    assert str(exc_info.value) == "at least one validator must be specified"
+
+
 def test_in_validator():
     validator = in_validator(range(3, 5))
 
@@ -2,7 +2,7 @@ import hashlib
 from unittest.mock import MagicMock, call
 
 import pytest
-from hypothesis import example, given
+from hypothesis import example, given, settings
 from hypothesis.strategies import builds, composite, from_regex, integers, one_of, text
 
 from tilediiif.core.templates import (
@@ -148,7 +148,7 @@ def test_render_template(populated_template):
     assert compiled.render(bindings) == expected
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def template_fields():
     return {
         "dynamic-field": lambda context: f'foo:{context["bar"]}',
@@ -156,27 +156,27 @@ def template_fields():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def template_context():
     return {"bar": 123}
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def template_string():
     return "prefix/{dynamic-field}-{const-field}"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def template(template_string):
     return parse_template(template_string)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def template_renderer(template, template_fields):
     return TemplateRenderer(template=template, fields=template_fields)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def template_bindings(template_fields, template_context):
     return TemplateBindings(template_fields, template_context)
 
@@ -224,16 +224,15 @@ def test_use_context_single(names, expected_call):
     assert func.mock_calls == [expected_call]
 
 
+@settings(max_examples=50, database=None)
 @given(key=text(), segment_count=integers(min_value=1, max_value=64))
 def test_shard_prefix_1(key, segment_count):
-    hashed = hashlib.blake2b(key.encode("utf-8"), digest_size=segment_count).hexdigest()
-    segments = []
-    for _ in range(segment_count):
-        seg, hashed = hashed[:2], hashed[2:]
-        segments.append(seg)
+    digest = hashlib.blake2b(key.encode("utf-8"), digest_size=segment_count).digest()
+    # Each segment is the hex representation of one byte of the digest
+    expected = "/".join(f"{byte:02x}" for byte in digest)
 
     prefix = shard_prefix(key, segment_count=segment_count)
-    assert prefix == "/".join(segments)
+    assert prefix == expected
     assert prefix.lower() == prefix
     assert len(prefix) > 0
     assert len(prefix) == segment_count * 2 + (segment_count - 1)
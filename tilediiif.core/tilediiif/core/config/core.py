@@ -2,18 +2,34 @@ import os
 import re
 from abc import ABC, abstractmethod
 from collections import OrderedDict
+from copy import deepcopy
 from dataclasses import dataclass
 from enum import Enum
 from functools import lru_cache, reduce
 from pathlib import Path
 from types import MappingProxyType
-from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Tuple, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import toml
 from jsonpath_rw import parse
 from jsonpath_rw.jsonpath import DatumInContext, JSONPath
-from jsonschema import ValidationError as JSONSchemaValidationError
-from jsonschema import validate
+from jsonschema.validators import validator_for
+
+try:
+    import tomllib
+except ModuleNotFoundError:  # Python < 3.11
+    tomllib = None  # type: ignore
 
 from tilediiif.core.config.exceptions import (
     CLIValueNotFound,
@@ -42,6 +58,8 @@ def identity(arg):
 
 @dataclass(frozen=True)
 class ConstDefaultFactory:
+    __slots__ = ("value", "value_hashable", "_hash")
+
     value: Any
     value_hashable: bool
 
@@ -55,6 +73,12 @@ class ConstDefaultFactory:
             except TypeError:
                 value_hashable = False
         object.__setattr__(self, "value_hashable", value_hashable)
+        # The value can't change, so neither can the hash
+        object.__setattr__(
+            self,
+            "_hash",
+            hash((value,)) if value_hashable else object.__hash__(self),
+        )
 
     def __call__(self, **_):
         return self.value
@@ -66,10 +90,7 @@ class ConstDefaultFactory:
             return object.__eq__(self, other)
 
     def __hash__(self):
-        if self.value_hashable:
-            return hash((self.value,))
-        else:
-            return object.__hash__(self)
+        return self._hash
 
 
 @dataclass(frozen=True)
@@ -78,6 +99,8 @@ class SimpleDefaultFactory:
     A decorator to convert a no-arg function into a default_factory function.
     """
 
+    __slots__ = ("fn",)
+
     fn: Callable
 
     def __call__(self, **_):
@@ -89,6 +112,8 @@ simple_default_factory = SimpleDefaultFactory
 
 @dataclass(frozen=True)
 class FrozenMapping(Mapping):
+    __slots__ = ("mapping",)
+
     mapping: Mapping
 
     def __init__(self, mapping: Mapping):
@@ -115,6 +140,15 @@ class FrozenMapping(Mapping):
 
 @dataclass(frozen=True)
 class ConfigProperty:
+    __slots__ = (
+        "name",
+        "default_factory",
+        "validator",
+        "normaliser",
+        "attrs",
+        "_const_default_validated",
+    )
+
     name: str
     default_factory: Callable[..., Any]
     validator: Callable[[Any], None]
@@ -143,13 +177,19 @@ class ConfigProperty:
         object.__setattr__(self, "validator", validator)
         object.__setattr__(self, "normaliser", normaliser)
         object.__setattr__(self, "attrs", FrozenMapping(attrs))
+        object.__setattr__(self, "_const_default_validated", False)
 
     def __get__(self, instance, owner):
         if instance is None:
             return self
 
+        # Equivalent to get_value(), but avoids its extra call on the common path
         try:
-            return self.get_value(instance)
+            return instance._property_values[self.name]
+        except KeyError:
+            pass
+        try:
+            return self.get_default(instance)
         except ConfigValueNotPresent:
             return None
 
@@ -173,11 +213,16 @@ class ConfigProperty:
         if self.default_factory is None:
             raise ConfigValueNotPresent(config=config, property=self)
         default = self.default_factory(config=config, property=self)
-        self.validate(default, is_default=True)
+        # Constant defaults only need validating on first use
+        if not self._const_default_validated:
+            self.validate(default, is_default=True)
+            if isinstance(self.default_factory, ConstDefaultFactory):
+                object.__setattr__(self, "_const_default_validated", True)
         return self.normalise(default)
 
     def set_value(self, config: "BaseConfig", value):
         config._property_values[self.name] = value
+        config._hash = None
 
     def __set__(self, instance, value):
         self.validate(value)
@@ -227,13 +272,13 @@ class ConfigProperty:
 
 def normalise_variant(variant) -> Tuple[str]:
     if variant is None:
-        variant = ()
+        return ()
     if isinstance(variant, str):
-        variant = (variant,)
+        return (variant,)
     return tuple(variant)
 
 
-@lru_cache()
+@lru_cache(maxsize=None)
 def _parse_function_attrs(variants):
     if not isinstance(variants, tuple) and all(isinstance(s, str) for s in variants):
         raise TypeError(f"variants must be a tuple of strings, got: {variants!r}")
@@ -243,7 +288,14 @@ def _parse_function_attrs(variants):
 
 
 class ConfigMeta(type):
-    def __init__(cls, name, bases, attrs):
+    def __new__(mcs, name, bases, attrs, abstract=None):
+        # class Foo(Config, abstract=True) is equivalent to setting
+        # is_abstract_config_cls = True in the class body.
+        if abstract is not None:
+            attrs["is_abstract_config_cls"] = abstract
+        return super().__new__(mcs, name, bases, attrs)
+
+    def __init__(cls, name, bases, attrs, abstract=None):
         super().__init__(name, bases, attrs)
         cls._set_up_config_class(name, bases, attrs)
 
@@ -254,6 +306,8 @@ class ParseResult(Enum):
 
 @dataclass(eq=False)
 class BaseConfigValues(Mapping):
+    __slots__ = ("config", "config_attr_name")
+
     config: "BaseConfig"
     config_attr_name: str
 
@@ -269,23 +323,27 @@ class BaseConfigValues(Mapping):
     def get_value(self, property: ConfigProperty):
         raise NotImplementedError()
 
-    def _get_property(self, name_or_prop: Union[ConfigProperty, str]):
-        name = name_or_prop if isinstance(name_or_prop, str) else name_or_prop.name
-        property = getattr(type(self.config), name, None)
-        if not isinstance(name_or_prop, str) and property is not name_or_prop:
-            raise AttributeError(name_or_prop)
-        return property
+    def _get_property(
+        self, name_or_prop: Union[ConfigProperty, str]
+    ) -> Optional[ConfigProperty]:
+        """Get the config's property with a name, or None if it has no such property."""
+        if isinstance(name_or_prop, str):
+            return self.config.properties().get(name_or_prop)
+        if isinstance(name_or_prop, ConfigProperty):
+            property = self.config.properties().get(name_or_prop.name)
+            if property is name_or_prop:
+                return property
+        return None
 
     def __contains__(self, name_or_prop: Union[ConfigProperty, str]):
-        try:
-            return self.has_value(self._get_property(name_or_prop))
-        except AttributeError:
-            return False
+        property = self._get_property(name_or_prop)
+        return property is not None and self.has_value(property)
 
     def __getitem__(self, name_or_prop: Union[ConfigProperty, str]) -> Any:
-        if name_or_prop in self:
-            return self.get_value(self._get_property(name_or_prop))
-        raise KeyError(property)
+        property = self._get_property(name_or_prop)
+        if property is None or not self.has_value(property):
+            raise KeyError(name_or_prop)
+        return self.get_value(property)
 
     def __getattr__(self, name: str):
         try:
@@ -304,12 +362,12 @@ class BaseConfigValues(Mapping):
 
     def __iter__(self) -> Iterator[ConfigProperty]:
         for property in self.config.properties().values():
-            if property in self:
+            if self.has_value(property):
                 yield property
 
     def __str__(self):
         content = ", ".join(
-            f"{property.name!r}: {value!r}" for property, value in self.items()
+            f"{property.name!r}: {self.get_value(property)!r}" for property in self
         )
         return f"{{{content}}}"
 
@@ -318,6 +376,8 @@ class BaseConfigValues(Mapping):
 
 
 class DefaultConfigValues(BaseConfigValues):
+    __slots__ = ()
+
     def has_value(self, property: ConfigProperty):
         return property.has_default()
 
@@ -326,6 +386,8 @@ class DefaultConfigValues(BaseConfigValues):
 
 
 class AllConfigValues(BaseConfigValues):
+    __slots__ = ()
+
     def has_value(self, property: ConfigProperty):
         return property.has_value(self.config, use_default=True)
 
@@ -334,14 +396,28 @@ class AllConfigValues(BaseConfigValues):
 
 
 class NonDefaultConfigValues(BaseConfigValues):
+    __slots__ = ()
+
     def has_value(self, property: ConfigProperty):
         return property.has_value(self.config, use_default=False)
 
     def get_value(self, property: ConfigProperty):
         return property.get_value(self.config, use_default=False)
 
+    def __len__(self) -> int:
+        return len(self.config._property_values)
+
+    def __iter__(self) -> Iterator[ConfigProperty]:
+        property_values = self.config._property_values
+        if not property_values:
+            return
+        for property in self.config.properties().values():
+            if property.name in property_values:
+                yield property
+
 
 class BaseConfig(metaclass=ConfigMeta):
+    __slots__ = ("_property_values", "_hash")
     is_abstract_config_cls = True
 
     @classmethod
@@ -350,15 +426,31 @@ class BaseConfig(metaclass=ConfigMeta):
             cls.is_abstract_config_cls = False
 
         if not cls.is_abstract_config_cls:
-            if not isinstance(getattr(cls, "property_definitions", None), list):
+            if not isinstance(
+                getattr(cls, "property_definitions", None), (list, tuple)
+            ):
                 raise TypeError(
                     f"{cls.__qualname__} must have a 'property_definitions' attribute "
                     "containing a list of ConfigProperty instances"
                 )
+            # Definitions are fixed once the class is created
+            if "property_definitions" in attrs:
+                cls.property_definitions = tuple(cls.property_definitions)
 
             for property in cls.property_definitions:
                 setattr(cls, property.name, property)
 
+        # Inherited definitions are merged once, when the class is created
+        cls._properties = MappingProxyType(
+            OrderedDict(
+                (property.name, property)
+                for classs in reversed(cls.mro())
+                if isinstance(classs, ConfigMeta)
+                and "property_definitions" in vars(classs)
+                for property in classs.property_definitions
+            )
+        )
+
     def __init__(self, values=None, **kwargs):
         property_values = {**({} if values is None else values), **kwargs}
         if not property_values.keys() <= self.properties().keys():
@@ -366,6 +458,7 @@ class BaseConfig(metaclass=ConfigMeta):
             raise ValueError(f"invalid property names: {names}")
 
         self._property_values = {}
+        self._hash = None
         for prop_name, value in property_values.items():
             # This updates values in self._property_values via ConfigProperty's
             # descriptor method __set__(), which results in the value being normalised
@@ -376,9 +469,12 @@ class BaseConfig(metaclass=ConfigMeta):
         return isinstance(other, BaseConfig) and self.values == other.values
 
     def __hash__(self):
-        # Note that the iterator order of values is deterministic (follows order of
-        # properties in cls.property_definitions)
-        return hash(tuple(self.values.items()))
+        # The hash is cached until a property value is set
+        if self._hash is None:
+            # Note that the iterator order of values is deterministic (follows order
+            # of properties in cls.property_definitions)
+            self._hash = hash(tuple(self.values.items()))
+        return self._hash
 
     def __repr__(self):
         return f"{type(self).__name__}({self})"
@@ -407,7 +503,6 @@ class BaseConfig(metaclass=ConfigMeta):
         return type(self)({**self._property_values, **other_config._property_values})
 
     @classmethod
-    @lru_cache()
     def properties(cls) -> Mapping[str, ConfigProperty]:
         """
         Get a read-only mapping of property names to ConfigProperty instances for this
@@ -416,15 +511,7 @@ class BaseConfig(metaclass=ConfigMeta):
         The iteration order of the mapping follows the definition order in
         cls.property_definitions.
         """
-        return MappingProxyType(
-            OrderedDict(
-                (property.name, property)
-                for classs in reversed(cls.mro())
-                if issubclass(classs, BaseConfig)
-                and hasattr(classs, "property_definitions")
-                for property in classs.property_definitions
-            )
-        )
+        return cls._properties
 
     @classmethod
     def parse(
@@ -458,6 +545,7 @@ class EmptyEnvar(Enum):
 
 
 class EnvironmentConfigMixin(BaseConfig):
+    __slots__ = ()
     is_abstract_config_cls = True
 
     @classmethod
@@ -465,11 +553,7 @@ class EnvironmentConfigMixin(BaseConfig):
         if envars is None:
             envars = os.environ
 
-        envar_props = [
-            (prop.attrs["envar_name"], property_name, prop)
-            for property_name, prop in cls.properties().items()
-            if "envar_name" in prop.attrs
-        ]
+        envar_props = cls.envar_properties()
 
         raw_values = {
             property_name: envars[envar]
@@ -489,6 +573,19 @@ class EnvironmentConfigMixin(BaseConfig):
                 f"loading config from envars {envar_names} failed: {e}"
             )
 
+    @classmethod
+    @lru_cache()
+    def envar_properties(cls) -> Tuple[Tuple[str, str, ConfigProperty], ...]:
+        """
+        Get the (envar name, property name, property) of each property with an
+        envar_name.
+        """
+        return tuple(
+            (prop.attrs["envar_name"], property_name, prop)
+            for property_name, prop in cls.properties().items()
+            if "envar_name" in prop.attrs
+        )
+
     @staticmethod
     @delegating_parser(property=True)
     def parse_envar_default(value: str, *, next, property):
@@ -501,6 +598,7 @@ class EnvironmentConfigMixin(BaseConfig):
 
 
 class JSONConfigMixin(BaseConfig):
+    __slots__ = ()
     is_abstract_config_cls = True
     parse_json_default = parse_string_values
 
@@ -525,15 +623,15 @@ class JSONConfigMixin(BaseConfig):
                 ".json_schema is None. Set json_schema to True to enable from_json() "
                 "without schema validation."
             )
-        try:
-            validate(obj, schema=cls.json_schema)
-        except JSONSchemaValidationError as e:
+        # Report the first error found rather than searching for the best match
+        error = next(cls.json_schema_validator().iter_errors(obj), None)
+        if error is not None:
             prefix = (
                 "Configuration data is invalid"
                 if name is None
                 else f"Configuration data from {name} is invalid"
             )
-            raise ConfigError(f"{prefix}: {e}") from e
+            raise ConfigError(f"{prefix}: {error}") from error
 
         property_values = {}
         for name, _, extractor in cls.json_properties():
@@ -553,6 +651,21 @@ class JSONConfigMixin(BaseConfig):
             },
         )
 
+    @classmethod
+    def json_schema_validator(cls):
+        """
+        Get a jsonschema validator for cls.json_schema.
+
+        The schema is checked and the validator created once per config class, and
+        again if the class's json_schema is replaced.
+        """
+        validator = cls.__dict__.get("_json_schema_validator")
+        if validator is None or validator.schema is not cls.json_schema:
+            validator_cls = validator_for(cls.json_schema)
+            validator_cls.check_schema(cls.json_schema)
+            validator = cls._json_schema_validator = validator_cls(cls.json_schema)
+        return validator
+
     @staticmethod
     @delegating_parser(property=True)
     def parse_jsonpath_default(
@@ -577,12 +690,18 @@ class JSONConfigMixin(BaseConfig):
             ) from e
 
     @classmethod
-    def json_properties(cls) -> List[Tuple[str, ConfigProperty, JSONPath]]:
-        return [
+    @lru_cache()
+    def json_properties(cls) -> Tuple[Tuple[str, ConfigProperty, JSONPath], ...]:
+        """
+        Get the (name, property, extractor) of each property with a json_path.
+
+        The json_path expressions are parsed once per config class.
+        """
+        return tuple(
             (p.name, p, cls.get_json_value_extractor(p))
             for p in cls.properties().values()
             if "json_path" in p.attrs
-        ]
+        )
 
     @classmethod
     def get_json_value_extractor(cls, property) -> JSONPath:
@@ -605,13 +724,14 @@ class JSONConfigMixin(BaseConfig):
 
 
 class TOMLConfigMixin(JSONConfigMixin):
+    __slots__ = ()
     is_abstract_config_cls = True
 
     @classmethod
     def from_toml_file(cls, f, name=None):
         try:
-            data = toml.load(f)
-        except toml.TomlDecodeError as e:
+            data = load_toml(f)
+        except TOML_DECODE_ERRORS as e:
             raise ConfigError(f"Unable to parse {get_name(f)} as TOML: {e}") from e
         except OSError as e:
             raise ConfigError(f"Unable to read {get_name(f)}: {e}") from e
@@ -735,6 +855,7 @@ class CLIFlag(BaseCLIValue):
 
 
 class CommandLineArgConfigMixin(BaseConfig):
+    __slots__ = ()
     is_abstract_config_cls = True
     parse_cli_arg_default = parse_string_values
 
@@ -804,6 +925,7 @@ class Config(
     TOMLConfigMixin,
     BaseConfig,
 ):
+    __slots__ = ()
     is_abstract_config_cls = True
 
     @classmethod
@@ -822,6 +944,46 @@ class Config(
         return reduce(lambda conf, next_conf: conf.merged_with(next_conf), configs)
 
 
+TOML_DECODE_ERRORS = (toml.TomlDecodeError,) + (
+    () if tomllib is None else (tomllib.TOMLDecodeError,)
+)
+
+
+DISABLE_CONFIG_CACHE_ENVAR = "TILEDIIIF_DISABLE_CONFIG_CACHE"
+
+
+def load_toml(f):
+    """
+    Load TOML data from a file path or a text file object.
+
+    The stdlib's tomllib is used where available, as it's faster than the toml
+    package, which is used on Python versions without tomllib.
+
+    Files loaded by path are parsed once and cached until their mtime or size
+    changes. Set TILEDIIIF_DISABLE_CONFIG_CACHE=true to always re-read them.
+    """
+    if isinstance(f, (str, Path)):
+        if os.environ.get(DISABLE_CONFIG_CACHE_ENVAR) == "true":
+            return _load_toml_file(str(f))
+        stat = os.stat(f)
+        return deepcopy(_load_toml_file_cached(str(f), stat.st_mtime_ns, stat.st_size))
+    if tomllib is None:
+        return toml.load(f)
+    return tomllib.loads(f.read())
+
+
+def _load_toml_file(path: str):
+    if tomllib is None:
+        return toml.load(path)
+    with open(path, "rb") as binary_file:
+        return tomllib.load(binary_file)
+
+
+@lru_cache(maxsize=32)
+def _load_toml_file_cached(path: str, mtime_ns: int, size: int):
+    return _load_toml_file(path)
+
+
 def get_name(f):
     if isinstance(f, (str, Path)):
         return str(f)
@@ -53,19 +53,10 @@ def delegating_parser(
     :arg default_parsers If True, the decorated function receives the default_parsers
          kwarg.
     """
-    enabled_kwargs = set(
-        kwarg
-        for kwarg in [
-            "next",
-            "property" if property else None,
-            "variant" if variant else None,
-            "default_parsers" if default_parsers else None,
-        ]
-        if kwarg is not None
-    )
-
-    def filter_parse_func_kwargs(**kwargs):
-        return {arg: value for arg, value in kwargs.items() if arg in enabled_kwargs}
+    # The kwargs to pass are decided once here, not on every call of the parser
+    pass_property = bool(property)
+    pass_variant = bool(variant)
+    pass_default_parsers = bool(default_parsers)
 
     def decorate(parse_func: Callable):
         @wraps(parse_func)
@@ -90,15 +81,14 @@ def delegating_parser(
                     value, variant=variant, default_parsers=default_parsers
                 )
 
-            return parse_func(
-                value,
-                **filter_parse_func_kwargs(
-                    next=next,
-                    property=property,
-                    variant=variant,
-                    default_parsers=default_parsers,
-                ),
-            )
+            kwargs = {"next": next}
+            if pass_property:
+                kwargs["property"] = property
+            if pass_variant:
+                kwargs["variant"] = variant
+            if pass_default_parsers:
+                kwargs["default_parsers"] = default_parsers
+            return parse_func(value, **kwargs)
 
         return parse
 
@@ -108,21 +98,40 @@ def delegating_parser(
 E = TypeVar("E", bound=enum.Enum)
 
 
-def enum_list_parser(enum_cls: Type[E]):
+def enum_list_parser(enum_cls: Union[Type[E], Callable[[str], E]]):
+    if not (isinstance(enum_cls, type) and issubclass(enum_cls, enum.Enum)):
+        # A function mapping a string to an enum member, e.g. a for_label() method
+        @simple_parser
+        def parse_list(value: str) -> List[E]:
+            return [enum_cls(v.strip()) for v in value.split(",")]
+
+        return parse_list
+
+    members = {member.value: member for member in enum_cls}
+
     @simple_parser
     def parse_enum_list(value: str) -> List[E]:
-        return [enum_cls(v.strip()) for v in value.split(",")]
+        values = [v.strip() for v in value.split(",")]
+        try:
+            return [members[v] for v in values]
+        except KeyError:
+            # Let the enum report invalid values (or handle them via _missing_())
+            return [enum_cls(v) for v in values]
 
     return parse_enum_list
 
 
+_STRICT_BOOL_VALUES = {"true": True, "false": False}
+
+
 @simple_parser
 def parse_bool_strict(value: str):
-    if value not in ("true", "false"):
+    try:
+        return _STRICT_BOOL_VALUES[value]
+    except (KeyError, TypeError):
         raise ConfigParseError(
             f"boolean value must be 'true' or 'false', got: {value!r}"
-        )
-    return value == "true"
+        ) from None
 
 
 @delegating_parser
@@ -8,6 +8,8 @@ from tilediiif.core.config.validation import all_validator, isinstance_validator
 
 
 class IntConfigProperty(ConfigProperty):
+    __slots__ = ()
+
     def __init__(self, name, validator=None, **kwargs):
         _validator = isinstance_validator(int)
         if validator is not None:
@@ -19,6 +21,8 @@ class IntConfigProperty(ConfigProperty):
 
 
 class BoolConfigProperty(ConfigProperty):
+    __slots__ = ()
+
     def __init__(self, name, **kwargs):
         super().__init__(
             name,
@@ -31,6 +35,8 @@ class BoolConfigProperty(ConfigProperty):
 
 
 class EnumConfigProperty(ConfigProperty):
+    __slots__ = ()
+
     def __init__(self, name, enum_cls: Type[enum.Enum], **kwargs):
         super().__init__(
             name,
@@ -43,6 +49,8 @@ class EnumConfigProperty(ConfigProperty):
 
 
 class PathConfigProperty(ConfigProperty):
+    __slots__ = ()
+
     def __init__(self, name, **kwargs):
         super().__init__(
             name,
@@ -70,6 +70,7 @@ def in_validator(group):
 
 
 def all_validator(*validators):
+    # Validators run in order; the first to fail stops validation.
     def validate_all(value):
         for validator in validators:
             validator(value)
@@ -77,6 +78,24 @@ def all_validator(*validators):
     return validate_all
 
 
+def any_validator(*validators):
+    if not validators:
+        raise ValueError("at least one validator must be specified")
+
+    # Validators run in order; the first to pass stops validation.
+    def validate_any(value):
+        errors = []
+        for validator in validators:
+            try:
+                validator(value)
+                return
+            except ConfigValidationError as e:
+                errors.append(str(e))
+        raise ConfigValidationError(f"all alternatives failed: {'; '.join(errors)}")
+
+    return validate_any
+
+
 validate_string = isinstance_validator(str)
 
 
@@ -84,7 +103,7 @@ def validate_no_duplicates(value):
     if not isinstance(value, (Iterable, Sized)):
         raise ValueError(f"{value!r} is not a Sized Iterable")
     counts = Counter(value)
-    if len(set(value)) != len(value):
+    if len(counts) != len(value):
         duplicates = [
             f"{val!r} appears {count} times"
             for val, count in counts.most_common()
@@ -1,4 +1,5 @@
 import logging
+from functools import lru_cache
 from unittest.mock import patch
 
 import pytest
@@ -13,9 +14,19 @@ def config():
     return ServerConfig()
 
 
+@pytest.fixture(scope="session")
+def cached_get_api():
+    """
+    get_api(), memoised by config value.
+
+    Only suitable for tests which don't patch anything used while creating the API.
+    """
+    return lru_cache(maxsize=None)(get_api)
+
+
 @pytest.fixture
-def client(config):
-    return testing.TestClient(get_api(config))
+def client(config, cached_get_api):
+    return testing.TestClient(cached_get_api(config))
 
 
 @pytest.fixture
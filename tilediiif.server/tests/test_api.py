@@ -1,32 +1,64 @@
 from pathlib import Path
-from unittest.mock import patch, sentinel
+from types import SimpleNamespace
+from unittest.mock import MagicMock, sentinel
 
 import falcon
 import pytest
-from tilediiif.core.config import ConfigError
+from tilediiif.core.config import Config, ConfigError
 
+from tilediiif.server import api as api_module
 from tilediiif.server.api import CONFIG_PATH_ENVAR, get_api
 from tilediiif.server.config import ConfigValueEnvars, ServerConfig
 
+DATA_DIR = Path(__file__).parent / "data"
+INVALID_TOML_PATH = DATA_DIR / "invalid_toml.toml"
+
+
+@pytest.fixture(scope="module")
+def config_mocks():
+    """
+    Mocks for config loading and route population.
+
+    The mocks are created once per module, and each test using one resets it and
+    patches it in with monkeypatch.
+    """
+    return SimpleNamespace(
+        from_toml_file=MagicMock(),
+        from_environ=MagicMock(),
+        populate_routes=MagicMock(),
+    )
+
+
+def _reset_and_patch(monkeypatch, target, name, mock, **attrs):
+    mock.reset_mock(return_value=True, side_effect=True)
+    mock.configure_mock(**attrs)
+    monkeypatch.setattr(target, name, mock)
+    return mock
+
 
 @pytest.fixture
-def mock_config_from_toml_file():
-    with patch("tilediiif.server.config.Config.from_toml_file") as mock:
-        yield mock
+def mock_config_from_toml_file(monkeypatch, config_mocks):
+    return _reset_and_patch(
+        monkeypatch, Config, "from_toml_file", config_mocks.from_toml_file
+    )
 
 
 @pytest.fixture
-def mock_config_from_environ():
-    with patch("tilediiif.server.config.Config.from_environ") as mock:
-        yield mock
+def mock_config_from_environ(monkeypatch, config_mocks):
+    return _reset_and_patch(
+        monkeypatch, Config, "from_environ", config_mocks.from_environ
+    )
 
 
 @pytest.fixture
-def mock_populate_routes():
-    with patch(
-        "tilediiif.server.api._populate_routes", side_effect=lambda api, _: api
-    ) as mock:
-        yield mock
+def mock_populate_routes(monkeypatch, config_mocks):
+    return _reset_and_patch(
+        monkeypatch,
+        api_module,
+        "_populate_routes",
+        config_mocks.populate_routes,
+        side_effect=lambda api, _: api,
+    )
 
 
 @pytest.fixture
@@ -79,9 +111,13 @@ def test_get_api_loads_config_from_envar_location_and_envar_values(
     api = get_api()
     mock_config_from_toml_file.assert_called_once_with(config_path_envar)
     mock_config_from_environ.assert_called_once()
-    mock_populate_routes.assert_called_once_with(
-        api, ServerConfig(data_path="foo", sendfile_header_name="bar")
-    )
+    mock_populate_routes.assert_called_once()
+    (routes_api, merged_config), _ = mock_populate_routes.call_args
+    assert routes_api is api
+    assert isinstance(merged_config, ServerConfig)
+    assert merged_config.data_path == "foo"
+    assert merged_config.sendfile_header_name == "bar"
+    assert len(merged_config.non_default_values) == 2
 
 
 def test_get_api_uses_default_config_if_no_config_specified(
@@ -93,9 +129,7 @@ def test_get_api_uses_default_config_if_no_config_specified(
 
 
 def test_get_api_throws_config_error_with_invalid_config(monkeypatch):
-    monkeypatch.setenv(
-        CONFIG_PATH_ENVAR, str(Path(__file__).parent / "data/invalid_toml.toml")
-    )
+    monkeypatch.setenv(CONFIG_PATH_ENVAR, str(INVALID_TOML_PATH))
 
     with pytest.raises(ConfigError) as exc_info:
         get_api()
@@ -10,12 +10,17 @@ from tilediiif.server.config import FileTransmissionType, ServerConfig
 DATA_DIR = Path(__file__).parent / "data"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def config_toml_path():
     return DATA_DIR / "config.toml"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def config_toml_data(config_toml_path):
+    return toml.load(config_toml_path)
+
+
+@pytest.fixture(scope="session")
 def config_toml_expected_config():
     return ServerConfig(
         sendfile_header_name="X-File",
@@ -46,13 +51,11 @@ def test_config_from_toml_file(config_toml_path, config_toml_expected_config):
     assert ServerConfig.from_toml_file(config_toml_path) == config_toml_expected_config
 
 
-def test_config_from_toml_uses_from_json(config_toml_path):
+def test_config_from_toml_uses_from_json(config_toml_path, config_toml_data):
     with patch("tilediiif.server.config.Config.from_json") as from_json:
         ServerConfig.from_toml_file(config_toml_path)
 
-    from_json.assert_called_once_with(
-        toml.load(config_toml_path), name=str(config_toml_path)
-    )
+    from_json.assert_called_once_with(config_toml_data, name=str(config_toml_path))
 
 
 @pytest.mark.parametrize(
@@ -8,6 +8,24 @@ from tilediiif.server.config import FileTransmissionType, ServerConfig
 
 TEST_DIR = Path(__file__).parent
 
+# Configs are created once at import, and shared by the parametrised tests using them.
+INDIRECT_CONFIG = ServerConfig(file_transmission=FileTransmissionType.INDIRECT)
+DIRECT_EXAMPLE_FILE_CONFIG = ServerConfig(
+    file_transmission=FileTransmissionType.DIRECT,
+    data_path=TEST_DIR,
+    info_json_path_template="data/example-file",
+)
+DIRECT_MISSING_FILE_CONFIG = ServerConfig(
+    file_transmission=FileTransmissionType.DIRECT,
+    data_path=TEST_DIR,
+    info_json_path_template="data/missing-file",
+)
+DIRECT_UNREADABLE_FILE_CONFIG = ServerConfig(
+    file_transmission=FileTransmissionType.DIRECT,
+    data_path=TEST_DIR,
+    info_json_path_template="data",
+)
+
 
 @pytest.mark.parametrize("url", ["/foo", "/foo/"])
 def test_image_resource_base_redirects_to_info_json(client: testing.TestClient, url):
@@ -20,11 +38,7 @@ def test_image_resource_base_redirects_to_info_json(client: testing.TestClient,
 @pytest.mark.parametrize(
     "config, sendfile_header_name, info_json_path",
     [
-        [
-            ServerConfig(file_transmission=FileTransmissionType.INDIRECT),
-            "X-Accel-Redirect",
-            "foo/info.json",
-        ],
+        [INDIRECT_CONFIG, "X-Accel-Redirect", "foo/info.json"],
         [
             ServerConfig(
                 file_transmission=FileTransmissionType.INDIRECT,
@@ -68,16 +82,7 @@ def test_image_info_resource_returns_sendfile_header_to_image(
     assert result.headers[sendfile_header_name] == info_json_path
 
 
-@pytest.mark.parametrize(
-    "config",
-    [
-        ServerConfig(
-            file_transmission=FileTransmissionType.DIRECT,
-            data_path=TEST_DIR,
-            info_json_path_template="data/example-file",
-        )
-    ],
-)
+@pytest.mark.parametrize("config", [DIRECT_EXAMPLE_FILE_CONFIG])
 def test_direct_transmission_type_responds_with_file_content(client):
     result = client.simulate_get("/foo/info.json")
     assert result.status == falcon.HTTP_OK
@@ -85,32 +90,14 @@ def test_direct_transmission_type_responds_with_file_content(client):
     assert result.content == b"example content\n"
 
 
-@pytest.mark.parametrize(
-    "config",
-    [
-        ServerConfig(
-            file_transmission=FileTransmissionType.DIRECT,
-            data_path=TEST_DIR,
-            info_json_path_template="data/missing-file",
-        )
-    ],
-)
+@pytest.mark.parametrize("config", [DIRECT_MISSING_FILE_CONFIG])
 def test_direct_transmission_type_responds_with_404_for_missing_file(client):
     result = client.simulate_get("/foo/info.json")
     assert result.status == falcon.HTTP_NOT_FOUND
     assert result.headers["Access-Control-Allow-Origin"] == "*"
 
 
-@pytest.mark.parametrize(
-    "config",
-    [
-        ServerConfig(
-            file_transmission=FileTransmissionType.DIRECT,
-            data_path=TEST_DIR,
-            info_json_path_template="data",
-        )
-    ],
-)
+@pytest.mark.parametrize("config", [DIRECT_UNREADABLE_FILE_CONFIG])
 def test_direct_transmission_type_responds_with_500_for_failed_file_read(
     client, mock_logger_exception
 ):
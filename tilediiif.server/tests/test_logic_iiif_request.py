@@ -14,115 +14,107 @@ from tilediiif.server.logic import (
     RelativeIIIFSize,
 )
 
-
-@pytest.mark.parametrize(
-    "region, expected",
+REGION_CASES = [
+    ["full", NamedIIIFRegion.FULL],
+    ["square", NamedIIIFRegion.SQUARE],
+    ["10,11,12,13", AbsoluteIIIFRegion(x=10, y=11, width=12, height=13)],
     [
-        ["full", NamedIIIFRegion.FULL],
-        ["square", NamedIIIFRegion.SQUARE],
-        ["10,11,12,13", AbsoluteIIIFRegion(x=10, y=11, width=12, height=13)],
-        [
-            "pct:10,11,12,13",
-            RelativeIIIFRegion(
-                x=Decimal(10), y=Decimal(11), width=Decimal(12), height=Decimal(13)
-            ),
-        ],
-        [
-            "pct:10.1,11.2,12.3,13.4",
-            RelativeIIIFRegion(
-                x=Decimal("10.1"),
-                y=Decimal("11.2"),
-                width=Decimal("12.3"),
-                height=Decimal("13.4"),
-            ),
-        ],
+        "pct:10,11,12,13",
+        RelativeIIIFRegion(
+            x=Decimal(10), y=Decimal(11), width=Decimal(12), height=Decimal(13)
+        ),
     ],
-)
-def test_parse_region_roundtrip(region, expected):
-    parsed = IIIFImageRequest.parse_region(region)
-    assert parsed == expected
-    assert str(parsed) == region
-
-
-@pytest.mark.parametrize(
-    "size, expected",
     [
-        ["full", NamedIIIFSize.FULL],
-        ["max", NamedIIIFSize.MAX],
-        ["23,", IIIFSize(23, None)],
-        [",23", IIIFSize(None, 23)],
-        ["23,32", IIIFSize(23, 32)],
-        ["!23,32", BestFitIIIFSize(23, 32)],
-        ["pct:23", RelativeIIIFSize(Decimal(23))],
-        ["pct:23.32", RelativeIIIFSize(Decimal("23.32"))],
+        "pct:10.1,11.2,12.3,13.4",
+        RelativeIIIFRegion(
+            x=Decimal("10.1"),
+            y=Decimal("11.2"),
+            width=Decimal("12.3"),
+            height=Decimal("13.4"),
+        ),
     ],
-)
-def test_parse_size_roundtrip(size, expected):
-    parsed = IIIFImageRequest.parse_size(size)
-    assert parsed == expected
-    assert str(parsed) == size
-
-
-@pytest.mark.parametrize(
-    "rotation, expected",
+]
+
+SIZE_CASES = [
+    ["full", NamedIIIFSize.FULL],
+    ["max", NamedIIIFSize.MAX],
+    ["23,", IIIFSize(23, None)],
+    [",23", IIIFSize(None, 23)],
+    ["23,32", IIIFSize(23, 32)],
+    ["!23,32", BestFitIIIFSize(23, 32)],
+    ["pct:23", RelativeIIIFSize(Decimal(23))],
+    ["pct:23.32", RelativeIIIFSize(Decimal("23.32"))],
+]
+
+ROTATION_CASES = [
+    ["0", IIIFRotation(False, Decimal(0))],
+    ["90", IIIFRotation(False, Decimal(90))],
+    ["90.99", IIIFRotation(False, Decimal("90.99"))],
+    ["!0", IIIFRotation(True, Decimal(0))],
+    ["!90", IIIFRotation(True, Decimal(90))],
+    ["!90.99", IIIFRotation(True, Decimal("90.99"))],
+]
+
+QUALITY_CASES = [["default", "default"], ["foo", "foo"]]
+
+FORMAT_CASES = [["jpg", "jpg"], ["foo", "foo"]]
+
+IMAGE_REQUEST_CASES = [
     [
-        ["0", IIIFRotation(False, Decimal(0))],
-        ["90", IIIFRotation(False, Decimal(90))],
-        ["90.99", IIIFRotation(False, Decimal("90.99"))],
-        ["!0", IIIFRotation(True, Decimal(0))],
-        ["!90", IIIFRotation(True, Decimal(90))],
-        ["!90.99", IIIFRotation(True, Decimal("90.99"))],
+        "full/full/0/default.png",
+        IIIFImageRequest(
+            NamedIIIFRegion.FULL,
+            NamedIIIFSize.FULL,
+            IIIFRotation(mirrored=False, degrees=Decimal(0)),
+            "default",
+            "png",
+        ),
     ],
-)
-def test_parse_rotation_roundtrip(rotation, expected):
-    parsed = IIIFImageRequest.parse_rotation(rotation)
-    assert parsed == expected
-    assert str(parsed) == rotation
-
-
-@pytest.mark.parametrize("quality, expected", [["default", "default"], ["foo", "foo"]])
-def test_parse_quality_roundtrip(quality, expected):
-    parsed = IIIFImageRequest.parse_quality(quality)
-    assert parsed == expected
-    assert str(parsed) == quality
-
-
-@pytest.mark.parametrize("format, expected", [["jpg", "jpg"], ["foo", "foo"]])
-def test_parse_format_roundtrip(format, expected):
-    parsed = IIIFImageRequest.parse_quality(format)
-    assert parsed == expected
-    assert str(parsed) == format
+    [
+        "1,2,3,4/5,6/7.5/foo.bar",
+        IIIFImageRequest(
+            region=AbsoluteIIIFRegion(1, 2, 3, 4),
+            size=IIIFSize(5, 6),
+            rotation=IIIFRotation(mirrored=False, degrees=Decimal("7.5")),
+            quality="foo",
+            format="bar",
+        ),
+    ],
+]
+
+
+PARSERS = {
+    "region": IIIFImageRequest.parse_region,
+    "size": IIIFImageRequest.parse_size,
+    "rotation": IIIFImageRequest.parse_rotation,
+    "quality": IIIFImageRequest.parse_quality,
+    "format": IIIFImageRequest.parse_format,
+    "request": IIIFImageRequest.parse_request,
+}
+
+ROUNDTRIP_CASES = [
+    (kind, string, expected)
+    for kind, cases in [
+        ("region", REGION_CASES),
+        ("size", SIZE_CASES),
+        ("rotation", ROTATION_CASES),
+        ("quality", QUALITY_CASES),
+        ("format", FORMAT_CASES),
+        ("request", IMAGE_REQUEST_CASES),
+    ]
+    for string, expected in cases
+]
 
 
 @pytest.mark.parametrize(
-    "request_path, expected",
-    [
-        [
-            "full/full/0/default.png",
-            IIIFImageRequest(
-                NamedIIIFRegion.FULL,
-                NamedIIIFSize.FULL,
-                IIIFRotation(mirrored=False, degrees=Decimal(0)),
-                "default",
-                "png",
-            ),
-        ],
-        [
-            "1,2,3,4/5,6/7.5/foo.bar",
-            IIIFImageRequest(
-                region=AbsoluteIIIFRegion(1, 2, 3, 4),
-                size=IIIFSize(5, 6),
-                rotation=IIIFRotation(mirrored=False, degrees=Decimal("7.5")),
-                quality="foo",
-                format="bar",
-            ),
-        ],
-    ],
+    "kind, string, expected",
+    ROUNDTRIP_CASES,
+    ids=[f"{kind}-{string}" for kind, string, _ in ROUNDTRIP_CASES],
 )
-def test_parse_iiif_image_request_roundtrip(request_path, expected):
-    parsed = IIIFImageRequest.parse_request(request_path)
+def test_parse_roundtrip(kind, string, expected):
+    parsed = PARSERS[kind](string)
     assert parsed == expected
-    assert str(parsed) == request_path
+    assert str(parsed) == string
 
 
 def test_parse_iiif_image_request_parts():
@@ -134,31 +126,32 @@ def test_parse_iiif_image_request_parts():
     assert IIIFImageRequest.parse_request(expected) == parsed
 
 
-@pytest.mark.parametrize(
-    "request_path, expected",
-    [
-        ["full/full/0/default.jpg", None],
-        ["pct:0,0,100,100/full/0/default.jpg", None],
-        ["pct:0,0,100,100/50,50/0/default.jpg", None],
-        ["0,0,100,100/50,/0/default.jpg", None],
-        ["0,0,100,100/,50/0/default.jpg", None],
-        ["0,0,100,100/50,50/0/default.jpg", "0,0,100,100/50,/0/default.jpg"],
-        ["full/full/360/default.jpg", "full/full/0/default.jpg"],
-        ["full/full/!360/default.jpg", "full/full/!0/default.jpg"],
-        ["full/full/365.3/default.jpg", "full/full/5.3/default.jpg"],
-        ["full/full/!365.3/default.jpg", "full/full/!5.3/default.jpg"],
-    ],
-)
+CANONICALISATION_CASES = [
+    ["full/full/0/default.jpg", None],
+    ["pct:0,0,100,100/full/0/default.jpg", None],
+    ["pct:0,0,100,100/50,50/0/default.jpg", None],
+    ["0,0,100,100/50,/0/default.jpg", None],
+    ["0,0,100,100/,50/0/default.jpg", None],
+    ["0,0,100,100/50,50/0/default.jpg", "0,0,100,100/50,/0/default.jpg"],
+    ["full/full/360/default.jpg", "full/full/0/default.jpg"],
+    ["full/full/!360/default.jpg", "full/full/!0/default.jpg"],
+    ["full/full/365.3/default.jpg", "full/full/5.3/default.jpg"],
+    ["full/full/!365.3/default.jpg", "full/full/!5.3/default.jpg"],
+]
+
+
+@pytest.mark.parametrize("request_path, expected", CANONICALISATION_CASES)
 def test_image_request_canonicalisation(request_path, expected):
     initial = IIIFImageRequest.parse_request(request_path)
     canonical = initial.canonical()
+    canonical_path = str(canonical)
 
     if expected is None:
         assert initial is canonical
-        assert str(canonical) == request_path
+        assert canonical_path == request_path
     else:
         assert initial is not canonical
-        assert str(canonical) == expected
+        assert canonical_path == expected
 
 
 def test_image_request_string_representation_normalises_real_numbers():
@@ -2,12 +2,14 @@ import importlib
 from unittest.mock import patch, sentinel
 
 
-def test_wsgi_module_exposes_application_attribute():
+def test_wsgi_module_exposes_application_attribute(monkeypatch):
     from tilediiif.server import wsgi
 
-    try:
-        with patch("tilediiif.server.api.get_api", return_value=sentinel.api):
-            importlib.reload(wsgi)
-            assert wsgi.application == sentinel.api
-    finally:
+    # Restore the module's original attributes after the test rather than reloading
+    # again; the reload rebinds both of them.
+    monkeypatch.setattr(wsgi, "application", wsgi.application)
+    monkeypatch.setattr(wsgi, "get_api", wsgi.get_api)
+
+    with patch("tilediiif.server.api.get_api", return_value=sentinel.api):
         importlib.reload(wsgi)
+        assert wsgi.application == sentinel.api
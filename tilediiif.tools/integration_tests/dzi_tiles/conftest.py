@@ -1,21 +1,33 @@
-from pathlib import Path
-from tempfile import TemporaryDirectory
-
 import pytest
 
 
+def pytest_collection_modifyitems(items):
+    """Group tests using generated DZIs by their source image, then overlap."""
+
+    def get_dzi_params(item):
+        params = getattr(getattr(item, "callspec", None), "params", {})
+        if "src_image_id" in params and "dzi_overlap" in params:
+            return params["src_image_id"], params["dzi_overlap"]
+        return None
+
+    indexes = [i for i, item in enumerate(items) if get_dzi_params(item) is not None]
+    # sorted() is stable, so the order of tests with the same params is retained
+    dzi_items = sorted((items[i] for i in indexes), key=get_dzi_params)
+    for i, item in zip(indexes, dzi_items):
+        items[i] = item
+
+
+# pytest retains and removes old basetemp directories itself, so these directories
+# are not deleted when the tests using them finish, which would otherwise mean
+# unlinking every tile of the generated DZIs.
 @pytest.fixture
-def tmp_data_path(tmp_path):
-    with TemporaryDirectory(dir=tmp_path) as path:
-        yield Path(path)
+def tmp_data_path(tmp_path_factory):
+    return tmp_path_factory.mktemp("dzi_data")
 
 
 @pytest.fixture(scope="session")
-def session_tmp_data_path():
-    with TemporaryDirectory(
-        prefix=f"pytest-{__name__}-",
-    ) as path:
-        yield Path(path)
+def session_tmp_data_path(tmp_path_factory):
+    return tmp_path_factory.mktemp("session_dzi_data")
 
 
 @pytest.fixture
@@ -1,11 +1,14 @@
+import functools
 import math
+import os
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from types import MappingProxyType
 
 import pytest
 import pyvips
-from hypothesis import given
+from hypothesis import given, settings
 from hypothesis.strategies import data, integers
 
 from integration_tests.data import (
@@ -14,7 +17,6 @@ from integration_tests.data import (
     TEST_IMG_PEARS_SRGB_EMBEDDED,
     TEST_IMG_PEARS_SRGB_STRIPPED,
 )
-from integration_tests.dzi_tiles.test_icc_profile_behaviour import image_as_ndarray
 from tilediiif.tools.dzi import parse_dzi_file
 
 from .test_icc_profile_behaviour import PROFILE_SRGB_PATH
@@ -28,6 +30,7 @@ SRC_IMAGES = {
     "pears_adobergb1998": TEST_IMG_PEARS_ADOBERGB1998_EMBEDDED,
     "pears_adobergb1998_stripped": TEST_IMG_PEARS_ADOBERGB1998_STRIPPED,
 }
+DZI_OVERLAPS = [0, 1, 10]
 
 
 @pytest.fixture(scope="session", params=SRC_IMAGES.keys())
@@ -42,7 +45,11 @@ def src_image_data(src_image_id):
 
 @pytest.fixture(scope="session")
 def dzi_path(session_tmp_data_path, src_image_id, dzi_overlap):
-    return session_tmp_data_path / f"{src_image_id}_overlap{dzi_overlap}"
+    return get_dzi_path(session_tmp_data_path, src_image_id, dzi_overlap)
+
+
+def get_dzi_path(data_path: Path, src_image_id: str, dzi_overlap: int) -> Path:
+    return data_path / f"{src_image_id}_overlap{dzi_overlap}"
 
 
 @pytest.fixture(scope="session")
@@ -51,8 +58,23 @@ def src_image_path(src_image_data):
 
 
 @pytest.fixture(scope="session")
-def src_image(src_image_path, src_image_data):
-    img = pyvips.Image.new_from_file(str(src_image_path))
+def src_image_srgb_cached(
+    src_image_id, src_image_path, src_image_data, session_tmp_data_path
+):
+    """The path of a copy of the source image, converted to sRGB in the vips format.
+
+    The ICC transform is only performed once per source image, subsequent uses of the
+    same src_image_id re-use the existing file. Files in the vips format are memory
+    mapped when opened, so re-opening them is cheap.
+    """
+    cached_path = session_tmp_data_path / f"{src_image_id}.v"
+    if not cached_path.exists():
+        img = pyvips.Image.new_from_file(str(src_image_path), access="sequential")
+        convert_to_srgb(img, src_image_data).write_to_file(str(cached_path))
+    return cached_path
+
+
+def convert_to_srgb(img, src_image_data):
     cpl = src_image_data["colour_profile_location"]
     if cpl == "embedded":
         return img.icc_transform(
@@ -70,13 +92,12 @@ def src_image(src_image_path, src_image_data):
     raise AssertionError(f"Unable to handle src_image_data: {src_image_data}")
 
 
-@pytest.fixture(scope="session", params=[0, 1, 10])
+@pytest.fixture(scope="session", params=DZI_OVERLAPS)
 def dzi_overlap(request):
     return request.param
 
 
-@pytest.fixture(scope="session")
-def colour_handling_args(src_image_data):
+def get_colour_handling_args(src_image_data):
     cpl = src_image_data["colour_profile_location"]
     if cpl == "embedded":
         return []
@@ -91,9 +112,23 @@ def colour_handling_args(src_image_data):
     raise AssertionError(f"Unable to handle src_image_data: {src_image_data}")
 
 
-@pytest.fixture(scope="session")
-def generated_dzi(src_image_path, dzi_path, dzi_overlap, colour_handling_args):
-    result = subprocess.run(
+def get_dzi_tiles_env(vips_concurrency: int):
+    """Get the environment to run dzi-tiles with.
+
+    vips_concurrency is the number of threads each dzi-tiles process may use, so that
+    concurrent runs share the CPUs rather than each trying to use them all. The
+    (modestly-sized) images vips decompresses are kept in memory rather than in
+    temporary files.
+    """
+    return {
+        **os.environ,
+        "VIPS_CONCURRENCY": str(vips_concurrency),
+        "VIPS_DISC_THRESHOLD": "1g",
+    }
+
+
+def generate_dzi(src_image_data, dzi_path, dzi_overlap, *, vips_concurrency):
+    return subprocess.run(
         [
             "dzi-tiles",
             # use excessive quality to minimise differences from JPEG losses
@@ -101,19 +136,71 @@ def generated_dzi(src_image_path, dzi_path, dzi_overlap, colour_handling_args):
             "--no-jpeg-subsample",
             "--dzi-overlap",
             str(dzi_overlap),
-            *colour_handling_args,
-            src_image_path,
+            *get_colour_handling_args(src_image_data),
+            src_image_data["path"],
             dzi_path,
         ],
+        env=get_dzi_tiles_env(vips_concurrency),
         capture_output=True,
         encoding="utf-8",
     )
+
+
+@pytest.fixture(scope="session")
+def generated_dzis(request, session_tmp_data_path):
+    """Generate the DZIs needed by the collected tests concurrently.
+
+    Each dzi-tiles run is independent of the others, so running them in parallel
+    rather than one at a time as each parametrised fixture is first used reduces the
+    time spent waiting for them. The subprocesses do the work, so threads are
+    sufficient to wait on them. Only the combinations of source image and overlap
+    used by collected tests are generated, and at most one run per CPU happens at
+    once, with the CPUs shared between the runs' vips threads.
+
+    :returns: A mapping of (src_image_id, dzi_overlap) to the dzi-tiles result.
+    """
+    keys = get_collected_dzi_keys(request.session.items)
+
+    cpus = os.cpu_count() or 1
+    max_workers = max(1, min(len(keys), cpus))
+
+    def generate(key):
+        src_image_id, dzi_overlap = key
+        return generate_dzi(
+            SRC_IMAGES[src_image_id],
+            get_dzi_path(session_tmp_data_path, src_image_id, dzi_overlap),
+            dzi_overlap,
+            vips_concurrency=max(1, cpus // max_workers),
+        )
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return MappingProxyType(dict(zip(keys, executor.map(generate, keys))))
+
+
+def get_collected_dzi_keys(items):
+    """Get the (src_image_id, dzi_overlap) pairs that collected test items use."""
+    keys = set()
+    for item in items:
+        params = getattr(getattr(item, "callspec", None), "params", {})
+        if "src_image_id" in params and "dzi_overlap" in params:
+            keys.add((params["src_image_id"], params["dzi_overlap"]))
+    return sorted(keys)
+
+
+@pytest.fixture(scope="session")
+def generated_dzi(generated_dzis, src_image_id, dzi_overlap):
+    result = generated_dzis[src_image_id, dzi_overlap]
     assert result.returncode == 0, result.stderr
 
 
 @pytest.fixture(scope="session")
 def max_dzi_level(dzi_meta):
-    return math.ceil(math.log2(max(dzi_meta["width"], dzi_meta["height"])))
+    return get_max_dzi_level(dzi_meta["width"], dzi_meta["height"])
+
+
+@functools.lru_cache(maxsize=None)
+def get_max_dzi_level(width: int, height: int) -> int:
+    return math.ceil(math.log2(max(width, height)))
 
 
 @pytest.fixture(scope="session")
@@ -125,12 +212,17 @@ def min_dzi_level(dzi_meta):
 
 @pytest.fixture(scope="session")
 def get_tile_count(dzi_meta, max_dzi_level):
+    width, height = dzi_meta["width"], dzi_meta["height"]
+    tile_size = dzi_meta["tile_size"]
+
     def get_tile_count(level: int):
         assert 0 <= level <= max_dzi_level
         scale = 2 ** (max_dzi_level - level)
 
-        sizes = dzi_meta["width"], dzi_meta["height"]
-        return tuple(math.ceil(size / scale / dzi_meta["tile_size"]) for size in sizes)
+        return (
+            math.ceil(width / scale / tile_size),
+            math.ceil(height / scale / tile_size),
+        )
 
     return get_tile_count
 
@@ -154,82 +246,173 @@ def tile_levels_strategy(min_dzi_level, max_dzi_level):
 
 @pytest.fixture(scope="session")
 def dzi_meta(generated_dzi, dzi_path):
+    return load_dzi_meta(str(dzi_path))
+
+
+@functools.lru_cache(maxsize=None)
+def load_dzi_meta(dzi_path: str):
     return MappingProxyType(parse_dzi_file(f"{dzi_path}.dzi"))
 
 
+# Each example runs a vips pipeline over a tile, so the number of examples is limited.
+# The edge tiles, where crops are clamped, are always checked by
+# test_generated_dzi_corner_tiles_match_src_image().
+@settings(max_examples=25, deadline=None)
 @given(data=data())
 def test_generated_dzi_tiles_match_src_image(
     data,
-    src_image,
-    dzi_meta,
-    dzi_path,
     tile_levels_strategy,
     get_tile_coords_strategies,
+    get_tile_deltae,
 ):
     level = data.draw(tile_levels_strategy)
     xs, ys = get_tile_coords_strategies(level)
     x, y = data.draw(xs), data.draw(ys)
 
-    tile_deltae = get_tile_deltae(
-        src_img=src_image, dzi_path=dzi_path, level=level, x=x, y=y, dzi_meta=dzi_meta
-    )
+    tile_deltae = get_tile_deltae(level, x, y)
+
+    assert tile_deltae.avg() < 0.7
+
+
+@pytest.mark.parametrize(
+    "is_right, is_bottom", [[False, False], [True, False], [False, True], [True, True]]
+)
+@pytest.mark.parametrize("is_max_level", [False, True])
+def test_generated_dzi_corner_tiles_match_src_image(
+    is_right,
+    is_bottom,
+    is_max_level,
+    min_dzi_level,
+    max_dzi_level,
+    get_tile_count,
+    get_tile_deltae,
+):
+    level = max_dzi_level if is_max_level else min_dzi_level
+    tiles_x, tiles_y = get_tile_count(level)
+    x = tiles_x - 1 if is_right else 0
+    y = tiles_y - 1 if is_bottom else 0
 
-    assert image_as_ndarray(tile_deltae).mean() < 0.7
+    tile_deltae = get_tile_deltae(level, x, y)
 
+    assert tile_deltae.avg() < 0.7
 
-def get_tile_deltae(
-    *, src_img: pyvips.Image, dzi_path: Path, level: int, x: int, y: int, dzi_meta=None
+
+@pytest.fixture(scope="session")
+def get_tile_deltae(src_image_srgb_cached, dzi_path, dzi_meta, max_dzi_level):
+    src_image_path, dzi_path = str(src_image_srgb_cached), str(dzi_path)
+    width, height = dzi_meta["width"], dzi_meta["height"]
+    tile_size, overlap = dzi_meta["tile_size"], dzi_meta["overlap"]
+    fmt = dzi_meta["format"]
+
+    def get_tile_deltae(level: int, x: int, y: int):
+        return calculate_tile_deltae(
+            src_image_path=src_image_path,
+            dzi_path=dzi_path,
+            level=level,
+            x=x,
+            y=y,
+            width=width,
+            height=height,
+            max_level=max_dzi_level,
+            tile_size=tile_size,
+            overlap=overlap,
+            fmt=fmt,
+        )
+
+    return get_tile_deltae
+
+
+def calculate_tile_deltae(
+    *,
+    src_image_path: str,
+    dzi_path: str,
+    level: int,
+    x: int,
+    y: int,
+    width: int,
+    height: int,
+    max_level: int,
+    tile_size: int,
+    overlap: int,
+    fmt: str,
 ):
     """Calculate the colour difference between a single DZI tile and a reference image.
 
-    :arg src_img The 100% scale reference image. Subregions will be compared with the
-                 selected tile.
+    :arg src_image_path The path of the 100% scale reference image. Subregions of it
+                        (scaled to the tile's level) will be compared with the selected
+                        tile.
+    :arg width, height, max_level, tile_size, overlap, fmt The DZI's metadata.
     :returns an image of the same size as the selected tile, where each pixel is the
              CIE 2000 Colour-Difference Delta E difference between the reference and the
              actual DZI tile at that pixel.
     """
+    assert 0 <= level <= max_level
+
+    src_image = load_src_image_at_level(src_image_path, 1)
+    assert src_image.width == width
+    assert src_image.height == height
+
+    scale = 2 ** (max_level - level)
+    level_img = load_src_image_at_level(src_image_path, scale)
+
     # Assume the source image is in a format with defined colours, e.g. 'srgb'
-    # interpretation. dE00() internally invokes colourspace('LAB'), so src_img can be
+    # interpretation. dE00() internally invokes colourspace('LAB'), so the image can be
     # in any interpretation that vips supports as input to colourspace().
-    assert src_img.interpretation == pyvips.Interpretation.SRGB
-    if dzi_meta is None:
-        dzi_meta = parse_dzi_file(f"{dzi_path}.dzi")
+    assert level_img.interpretation == pyvips.Interpretation.SRGB
+
+    left = x * tile_size - overlap
+    top = y * tile_size - overlap
+    right = left + tile_size + overlap * 2
+    bottom = top + tile_size + overlap * 2
+    clamped_left = max(0, left)
+    clamped_top = max(0, top)
+    clamped_right = min(level_img.width, right)
+    clamped_bottom = min(level_img.height, bottom)
+
+    src_tile = level_img.crop(
+        clamped_left,
+        clamped_top,
+        clamped_right - clamped_left,
+        clamped_bottom - clamped_top,
+    )
 
-    assert src_img.width == dzi_meta["width"]
-    assert src_img.height == dzi_meta["height"]
+    dzi_tile_lab = load_dzi_tile_lab(dzi_path, level, x, y, fmt)
+    assert src_tile.width == dzi_tile_lab.width
+    assert src_tile.height == dzi_tile_lab.height
 
-    max_level = math.ceil(math.log2(max(dzi_meta["width"], dzi_meta["height"])))
-    assert 0 <= level <= max_level
+    return src_tile.dE00(dzi_tile_lab)
 
-    scale = 2 ** (max_level - level)
-    tile_size = dzi_meta["tile_size"]
-    src_overlap = dzi_meta["overlap"] * scale
-    src_tile_size = tile_size * scale
-
-    src_left = x * src_tile_size - src_overlap
-    src_top = y * src_tile_size - src_overlap
-    src_right = src_left + src_tile_size + src_overlap * 2
-    src_bottom = src_top + src_tile_size + src_overlap * 2
-    clamped_src_left = max(0, src_left)
-    clamped_src_top = max(0, src_top)
-    clamped_src_right = min(src_img.width, src_right)
-    clamped_src_bottom = min(src_img.height, src_bottom)
-
-    src_tile = src_img.crop(
-        clamped_src_left,
-        clamped_src_top,
-        clamped_src_right - clamped_src_left,
-        clamped_src_bottom - clamped_src_top,
-    ).shrink(scale, scale)
 
+@functools.lru_cache(maxsize=None)
+def load_src_image_at_level(src_image_path: str, scale: int):
+    """Load a source image, box-filtered to the scale of a DZI level.
+
+    shrink() averages each scale x scale block of pixels, as dzsave does when it
+    builds each level from the one above, so a tile-sized crop of the result is
+    the same as shrinking the tile's region of the full-size image. Tile regions
+    start at multiples of the scale, so the blocks line up either way.
+
+    The full-size image is a memory-mapped vips file, so it's returned as-is;
+    only the shrunk levels, which together are at most a third of its size, are
+    kept in memory.
+    """
+    src_image = pyvips.Image.new_from_file(src_image_path)
+    if scale == 1:
+        return src_image
+    return src_image.shrink(scale, scale).copy_memory()
+
+
+@functools.lru_cache(maxsize=256)
+def load_dzi_tile_lab(dzi_path: str, level: int, x: int, y: int, fmt: str):
+    """Load a DZI tile, converted to LAB colour.
+
+    Hypothesis often draws the same tile several times (especially when shrinking),
+    so tiles are cached. The tile is decoded and converted into memory once, so that
+    the cached image can be used in multiple pipelines.
+    """
     dzi_tile = pyvips.Image.new_from_file(
-        f"{dzi_path}_files/{level}/{x}_{y}.{dzi_meta['format']}"
+        f"{dzi_path}_files/{level}/{x}_{y}.{fmt}", access="sequential"
     )
-    assert src_tile.width == dzi_tile.width
-    assert src_tile.height == dzi_tile.height
-
     # Assume tiles are sRGB
     assert dzi_tile.interpretation == pyvips.Interpretation.SRGB
-    dzi_tile_lab = dzi_tile.colourspace(pyvips.Interpretation.LAB)
-
-    return src_tile.dE00(dzi_tile_lab)
+    return dzi_tile.colourspace(pyvips.Interpretation.LAB).copy_memory()
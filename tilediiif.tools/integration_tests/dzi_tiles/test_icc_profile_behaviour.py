@@ -5,7 +5,7 @@ import numpy as np
 import pytest
 import pyvips
 from hypothesis import given
-from hypothesis.strategies import integers, sampled_from
+from hypothesis.strategies import composite, integers, sampled_from
 
 from integration_tests.data import IMAGE_DATA, PROFILE_SRGB_PATH
 
@@ -20,6 +20,18 @@ IMAGE_SUNSET_P3_AS_SSRGB_RELATIVE_NOBPC = (
 IMAGE_SUNSET_P3_AS_SSRGB_PERCEPTUAL_NOBPC = (
     IMAGE_DATA / "Sunset-P3_as-sRGB-perceptual-noBPC.png"
 )
+VIPS_FORMAT_NUMPY_DTYPES = {
+    "uchar": np.uint8,
+    "char": np.int8,
+    "ushort": np.uint16,
+    "short": np.int16,
+    "uint": np.uint32,
+    "int": np.int32,
+    "float": np.float32,
+    "double": np.float64,
+    "complex": np.complex64,
+    "dpcomplex": np.complex128,
+}
 
 
 @pytest.mark.parametrize(
@@ -65,8 +77,10 @@ IMAGE_SUNSET_P3_AS_SSRGB_PERCEPTUAL_NOBPC = (
 def test_vips_colour_space_conversion(
     tx_method, pcs, input_image_path, expected_image_path, intent, profile
 ):
-    input_image = pyvips.Image.new_from_file(str(input_image_path))
-    expected_image = pyvips.Image.new_from_file(str(expected_image_path))
+    input_image = pyvips.Image.new_from_file(str(input_image_path), access="sequential")
+    expected_image = pyvips.Image.new_from_file(
+        str(expected_image_path), access="sequential"
+    )
 
     if tx_method == "import-export":
         pcs_image = input_image.icc_import(embedded=True, intent=intent, pcs=pcs)
@@ -80,52 +94,46 @@ def test_vips_colour_space_conversion(
         )
 
     # vips automatically does a colourspace() conversion to LAB if dE00() inputs are
-    # not LAB.
-    delta_img = expected_image.icc_import(
-        embedded=True, intent=pyvips.Intent.RELATIVE, pcs=pyvips.PCS.XYZ
-    ).dE00(
-        result_image.icc_import(
-            embedded=True, intent=pyvips.Intent.RELATIVE, pcs=pyvips.PCS.XYZ
-        )
-    )
+    # not LAB, but doing it explicitly makes the single conversion of each image clear.
+    expected_lab = to_lab(expected_image)
+    result_lab = to_lab(result_image)
+    # The inputs are read sequentially, so they can only be streamed through once. The
+    # delta image is small, so keep it in memory to compute several stats from it.
+    delta_img = expected_lab.dE00(result_lab).copy_memory()
 
     # Values are Delta E: 0 is identical, 1 is the smallest difference noticeable by a
     # human. See: http://zschuessler.github.io/DeltaE/learn/
-    delta = image_as_ndarray(delta_img)
-    assert delta.mean() < 0.1
-    assert delta.std() < 0.25
-    assert (delta >= 1).sum() / delta.size * 100 < 1.1
-    assert (delta >= 2).sum() / delta.size * 100 < 0.15
-    assert (delta >= 3).sum() / delta.size * 100 < 0.01
-    assert delta.max() < 4
+    # The reductions are done by vips rather than numpy, so the delta image doesn't
+    # need to be copied out of vips into a numpy array.
+    assert delta_img.avg() < 0.1
+    assert delta_img.deviate() < 0.25
+    assert percentage_at_least(delta_img, 1) < 1.1
+    assert percentage_at_least(delta_img, 2) < 0.15
+    assert percentage_at_least(delta_img, 3) < 0.01
+    assert delta_img.max() < 4
+
+
+def to_lab(image: pyvips.Image) -> pyvips.Image:
+    return image.icc_import(
+        embedded=True, intent=pyvips.Intent.RELATIVE, pcs=pyvips.PCS.XYZ
+    ).colourspace(pyvips.Interpretation.LAB)
+
+
+def percentage_at_least(image: pyvips.Image, threshold) -> float:
+    """Get the percentage of pixels in an image which are >= threshold."""
+    # Relational operations produce uchar images with 255 for true and 0 for false.
+    return (image >= threshold).avg() / 255 * 100
 
 
 def numpy_dtype(vips_format):
-    if isinstance(vips_format, pyvips.Image):
-        vips_format = vips_format.format
-    return {
-        "uchar": np.uint8,
-        "char": np.int8,
-        "ushort": np.uint16,
-        "short": np.int16,
-        "uint": np.uint32,
-        "int": np.int32,
-        "float": np.float32,
-        "double": np.float64,
-        "complex": np.complex64,
-        "dpcomplex": np.complex128,
-    }[vips_format]
+    """Get the numpy dtype of a vips format name or a vips Image's format."""
+    return VIPS_FORMAT_NUMPY_DTYPES[getattr(vips_format, "format", vips_format)]
 
 
 def image_as_ndarray(image: pyvips.Image):
-    return np.swapaxes(
-        np.ndarray(
-            buffer=image.write_to_memory(),
-            dtype=numpy_dtype(image),
-            shape=[image.height, image.width, image.bands],
-        ),
-        0,
-        1,
+    """Get the pixels of a vips image as a (height, width, bands) numpy array."""
+    return np.frombuffer(image.write_to_memory(), dtype=numpy_dtype(image)).reshape(
+        image.height, image.width, image.bands
     )
 
 
@@ -134,10 +142,12 @@ def image_as_ndarray(image: pyvips.Image):
     y=integers(min_value=0, max_value=IMAGE_SUNSET_P3_SIZE[1] - 1),
 )
 def test_image_as_ndarray(x, y):
-    img_vips = pyvips.Image.new_from_file(str(IMAGE_SUNSET_P3))
+    img_vips = pyvips.Image.new_from_file(
+        str(IMAGE_SUNSET_P3), access="sequential"
+    ).copy_memory()
     img_np = image_as_ndarray(img_vips)
 
-    assert tuple(img_np[x, y]) == tuple(img_vips(x, y))
+    assert tuple(img_np[y, x]) == tuple(img_vips(x, y))
 
 
 byte = integers(min_value=0, max_value=255)
@@ -145,11 +155,17 @@ short = integers(min_value=0, max_value=0xFFFF)
 profile_connection_spaces = sampled_from([pyvips.PCS.LAB, pyvips.PCS.XYZ])
 
 
-@given(r=byte, g=byte, b=byte)
-def test_srgb_lab_roundtrip(r, g, b):
-    img = pyvips.Image.new_from_memory(bytes([r, g, b]), 1, 1, 3, "uchar").copy(
+@composite
+def srgb_pixels(draw):
+    """Generate 1x1 pixel sRGB images."""
+    r, g, b = draw(byte), draw(byte), draw(byte)
+    return pyvips.Image.new_from_memory(bytes([r, g, b]), 1, 1, 3, "uchar").copy(
         interpretation=pyvips.Interpretation.SRGB
     )
+
+
+@given(img=srgb_pixels())
+def test_srgb_lab_roundtrip(img):
     img_lab2srgb = img.colourspace(pyvips.Interpretation.LAB).colourspace(
         pyvips.Interpretation.SRGB
     )
@@ -157,11 +173,8 @@ def test_srgb_lab_roundtrip(r, g, b):
     assert dist(img(0, 0), img_lab2srgb(0, 0)) <= 1
 
 
-@given(r=byte, g=byte, b=byte)
-def test_srgb_lab_roundtrip_icc_transform(r, g, b):
-    img = pyvips.Image.new_from_memory(bytes([r, g, b]), 1, 1, 3, "uchar").copy(
-        interpretation=pyvips.Interpretation.SRGB
-    )
+@given(img=srgb_pixels())
+def test_srgb_lab_roundtrip_icc_transform(img):
     img_lab2srgb = img.icc_transform(
         str(PROFILE_SRGB_PATH), input_profile=str(PROFILE_SRGB_PATH)
     )
@@ -170,11 +183,8 @@ def test_srgb_lab_roundtrip_icc_transform(r, g, b):
 
 
 @pytest.mark.xfail(reason="icc_import() with icc_export() doesnt seem very precise")
-@given(r=byte, g=byte, b=byte, pcs=profile_connection_spaces)
-def test_srgb_roundtrip_icc_import_icc_export(r, g, b, pcs):
-    img = pyvips.Image.new_from_memory(bytes([r, g, b]), 1, 1, 3, "uchar").copy(
-        interpretation=pyvips.Interpretation.SRGB
-    )
+@given(img=srgb_pixels(), pcs=profile_connection_spaces)
+def test_srgb_roundtrip_icc_import_icc_export(img, pcs):
     img_lab = img.icc_import(input_profile=str(PROFILE_SRGB_PATH), pcs=pcs)
     img_lab2srgb = img_lab.icc_export(output_profile=str(PROFILE_SRGB_PATH), pcs=pcs)
 
@@ -195,12 +205,8 @@ def test_srgb_roundtrip_icc_import_icc_export_16(r, g, b, pcs):
 
 
 @pytest.mark.xfail()
-@given(r=byte, g=byte, b=byte, pcs=profile_connection_spaces)
-def test_srgb_icc_import_matches_colourspace_func(r, g, b, pcs):
-    img = pyvips.Image.new_from_memory(bytes([r, g, b]), 1, 1, 3, "uchar").copy(
-        interpretation=pyvips.Interpretation.SRGB
-    )
-
+@given(img=srgb_pixels(), pcs=profile_connection_spaces)
+def test_srgb_icc_import_matches_colourspace_func(img, pcs):
     img_icc = img.icc_import(input_profile=str(PROFILE_SRGB_PATH), pcs=pcs)
     img_colourspace = img.colourspace(pcs)
 
@@ -218,7 +224,7 @@ def test_dist():
 
 
 def dist(a, b):
-    return math.sqrt(sum((_a - _b) ** 2 for _a, _b in zip(a, b)))
+    return math.hypot(*(_a - _b for _a, _b in zip(a, b)))
 
 
 @pytest.mark.xfail(
@@ -29,32 +29,28 @@ except ValueError as e:
     ) from e
 
 
-@pytest.fixture(
-    params=[
-        "--jpeg-trellis-quant",
-        "--jpeg-overshoot-deringing",
-        "--jpeg-optimize-scans",
-        "--jpeg-quant-table=3",
-    ]
-)
-def cli_option_requiring_mozjpeg(request):
-    return request.param
+CLI_OPTIONS_REQUIRING_MOZJPEG = [
+    "--jpeg-trellis-quant",
+    "--jpeg-overshoot-deringing",
+    "--jpeg-optimize-scans",
+    "--jpeg-quant-table=3",
+]
 
 
 @pytest.mark.skipif("EXPECT_MOZJPEG_SUPPORT == MozjpegSupport.ENABLED")
-def test_using_mozjpeg_options_without_mozjpeg_fails(
-    dzi_path,
-    cli_option_requiring_mozjpeg,
-):
+def test_using_mozjpeg_options_without_mozjpeg_fails(dzi_path):
+    # All the options are checked before failing, and each is reported in the error,
+    # so one dzi-tiles run can check all of them.
     result = subprocess.run(
         [
             "dzi-tiles",
-            cli_option_requiring_mozjpeg,
+            *CLI_OPTIONS_REQUIRING_MOZJPEG,
             PEARS_SMALL,
             dzi_path,
         ],
         env={
             "PATH": os.environ["PATH"],
+            "VIPS_CONCURRENCY": str(os.cpu_count() or 1),
         },
         capture_output=True,
         encoding="utf-8",
@@ -75,3 +71,10 @@ def test_using_mozjpeg_options_without_mozjpeg_fails(
         )
         assert "• libjpeg supports param API: False" in result.stderr
         assert "• libvips supports libjpeg params: False" in result.stderr
+        for name in [
+            "trellis_quant",
+            "overshoot_deringing",
+            "optimize_scans",
+            "quant_table",
+        ]:
+            assert f"• {name} = " in result.stderr
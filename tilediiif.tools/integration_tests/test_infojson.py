@@ -1,11 +1,12 @@
 import json
 import subprocess
+import sys
 from pathlib import Path
-from tempfile import TemporaryDirectory
 
 import pytest
+from tilediiif.core.filesystem import ensure_dir_exists
 
-from tilediiif.tools.infojson import DEFAULT_ID_BASE_URL
+from tilediiif.tools.infojson import DEFAULT_ID_BASE_URL, main
 
 PROJECT_DIR = Path(__file__).parents[1]
 DATA_DIR = PROJECT_DIR / "tests/data"
@@ -14,9 +15,8 @@ ID_URL = "https://images.cudl.lib.cam.ac.uk/iiif/MS-ADD-00269-000-01075"
 
 
 @pytest.fixture
-def tmp_data_path(tmp_path):
-    with TemporaryDirectory(dir=tmp_path) as path:
-        yield Path(path)
+def tmp_data_path(tmp_path_factory):
+    return tmp_path_factory.mktemp("infojson_data")
 
 
 @pytest.fixture
@@ -25,6 +25,53 @@ def info_json(info_json_path):
         return json.load(f)
 
 
+@pytest.fixture
+def run_infojson(capsys):
+    """Run the infojson command in-process, avoiding the cost of starting Python.
+
+    test_infojson_command_runs_as_subprocess() checks the installed command itself.
+    """
+
+    def run_infojson(argv, check=False):
+        argv = [str(arg) for arg in argv]
+        # Created directories are memoised for the life of the process, which would
+        # be incorrect after tests change the working directory.
+        ensure_dir_exists.cache_clear()
+        returncode = 0
+        try:
+            main(argv)
+        except SystemExit as e:
+            # docopt exits with its usage message as the exit code, which Python
+            # reports on stderr with status 1.
+            if isinstance(e.code, str):
+                print(e.code, file=sys.stderr)
+                returncode = 1
+            else:
+                returncode = e.code or 0
+        stdout, stderr = capsys.readouterr()
+        result = subprocess.CompletedProcess(
+            ["infojson", *argv], returncode, stdout, stderr
+        )
+        if check:
+            result.check_returncode()
+        return result
+
+    return run_infojson
+
+
+def test_infojson_command_runs_as_subprocess():
+    dzi_path = DATA_DIR / "MS-ADD-00269-000-01075.dzi"
+    result = subprocess.run(
+        ["infojson", "from-dzi", "--stdout", "--id-base-url", ID_BASE_URL, dzi_path],
+        capture_output=True,
+        encoding="utf-8",
+        check=True,
+    )
+
+    assert json.loads(result.stdout)["@id"] == ID_URL
+    assert result.stderr == ""
+
+
 @pytest.mark.parametrize(
     "argv, message",
     [
@@ -52,8 +99,8 @@ def info_json(info_json_path):
         ],
     ],
 )
-def test_infojson_fails_with_invalid_arguments(argv, message):
-    result = subprocess.run(["infojson"] + argv, capture_output=True, encoding="utf-8")
+def test_infojson_fails_with_invalid_arguments(argv, message, run_infojson):
+    result = run_infojson(argv)
     assert result.returncode == 1
     assert result.stdout == ""
     assert message in result.stderr
@@ -72,10 +119,11 @@ def test_infojson_fails_with_invalid_arguments(argv, message):
         ],
     ],
 )
-def test_infojson_generates_expected_output_on_stdout(dzi_path, info_json):
-    result = subprocess.run(
+def test_infojson_generates_expected_output_on_stdout(
+    dzi_path, info_json, run_infojson
+):
+    result = run_infojson(
         [
-            "infojson",
             "from-dzi",
             "--stdout",
             "--id-base-url",
@@ -84,8 +132,6 @@ def test_infojson_generates_expected_output_on_stdout(dzi_path, info_json):
             "MS-ADD-00269-000-01075",
             dzi_path,
         ],
-        capture_output=True,
-        encoding="utf-8",
         check=True,
     )
 
@@ -156,18 +202,14 @@ def test_infojson_writes_expected_output_file(
     expected_id_attr,
     tmp_data_path,
     monkeypatch,
+    run_infojson,
 ):
     if chdir:
         monkeypatch.chdir(tmp_data_path)
     else:
         options += ["--data-path", tmp_data_path]
 
-    result = subprocess.run(
-        ["infojson", "from-dzi"] + options + [dzi_path],
-        capture_output=True,
-        encoding="utf-8",
-        check=True,
-    )
+    result = run_infojson(["from-dzi"] + options + [dzi_path], check=True)
 
     assert result.stdout == ""
     assert result.stderr == ""
@@ -181,18 +223,15 @@ def test_infojson_writes_expected_output_file(
 
 
 @pytest.mark.parametrize("indent", [1, 2, 4])
-def test_indent(indent):
-    result = subprocess.run(
+def test_indent(indent, run_infojson):
+    result = run_infojson(
         [
-            "infojson",
             "from-dzi",
             "--stdout",
             "--indent",
             str(indent),
             DATA_DIR / "MS-ADD-00269-000-01075.dzi",
         ],
-        capture_output=True,
-        encoding="utf-8",
         check=True,
     )
 
@@ -201,18 +240,15 @@ def test_indent(indent):
     assert result.stdout.endswith("}\n")
 
 
-def test_indent_0_disables_indentation():
-    result = subprocess.run(
+def test_indent_0_disables_indentation(run_infojson):
+    result = run_infojson(
         [
-            "infojson",
             "from-dzi",
             "--stdout",
             "--indent",
             "0",
             DATA_DIR / "MS-ADD-00269-000-01075.dzi",
         ],
-        capture_output=True,
-        encoding="utf-8",
         check=True,
     )
 
@@ -1,30 +1,33 @@
 import math
+from functools import lru_cache
+from io import BytesIO
 from pathlib import Path
 
 import pytest
-from hypothesis import assume, given
+from hypothesis import given
 from hypothesis.strategies import (
     builds,
     characters,
     composite,
     integers,
+    just,
+    lists,
     sampled_from,
     text,
 )
 
-from tilediiif.tools.dzi import get_dzi_tile_path, parse_dzi_file
+from tilediiif.tools.dzi import DZIError, get_dzi_tile_path, parse_dzi_file
 from tilediiif.tools.tilelayout import get_layer_tiles
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def dzi_ms_add_path():
     return Path(__file__).parent / "data" / "MS-ADD-00269-000-01075.dzi"
 
 
-@pytest.fixture
-def dzi_ms_add_file(dzi_ms_add_path):
-    with open(dzi_ms_add_path, "rb") as f:
-        yield f
+@pytest.fixture(scope="session")
+def dzi_ms_add_bytes(dzi_ms_add_path):
+    return dzi_ms_add_path.read_bytes()
 
 
 @pytest.fixture
@@ -32,8 +35,38 @@ def dzi_ms_add_meta():
     return dict(width=6365, height=9841, format="jpg", overlap=1, tile_size=256)
 
 
-def test_parse_dzi_file(dzi_ms_add_file, dzi_ms_add_meta):
-    assert parse_dzi_file(dzi_ms_add_file) == dzi_ms_add_meta
+def test_parse_dzi_file(dzi_ms_add_path, dzi_ms_add_meta):
+    with open(dzi_ms_add_path, "rb") as f:
+        assert parse_dzi_file(f) == dzi_ms_add_meta
+
+
+def test_parse_dzi_file_accepts_bytes(dzi_ms_add_bytes, dzi_ms_add_meta):
+    assert parse_dzi_file(dzi_ms_add_bytes) == dzi_ms_add_meta
+    assert parse_dzi_file(memoryview(dzi_ms_add_bytes)) == dzi_ms_add_meta
+
+
+def test_parse_dzi_file_stops_reading_after_size_element(dzi_ms_add_meta):
+    # The trailing content is malformed, but is beyond the parser's first read
+    dzi = (
+        b'<Image TileSize="256" Overlap="1" Format="jpg"'
+        b' xmlns="http://schemas.microsoft.com/deepzoom/2008">'
+        b'<Size Width="6365" Height="9841"/>'
+        + b"<!--"
+        + b" " * 32 * 1024
+        + b"-->"
+        + b"<<not xml"
+    )
+    assert parse_dzi_file(BytesIO(dzi)) == dzi_ms_add_meta
+
+
+def test_parse_dzi_file_rejects_unexpected_root_element():
+    with pytest.raises(DZIError) as exc_info:
+        parse_dzi_file(BytesIO(b"<Foo/>"))
+    assert (
+        str(exc_info.value)
+        == "Unexpected root element, expected: "
+        "{http://schemas.microsoft.com/deepzoom/2008}Image, but is: Foo"
+    )
 
 
 path_segments = text(
@@ -42,20 +75,25 @@ path_segments = text(
     max_size=12,
 )
 fs_paths = builds(
-    lambda prefix, elements: Path(prefix) / Path(*elements),
+    lambda prefix, segments: Path(prefix + "/".join(segments)),
     sampled_from(["/", "./"]),
-    path_segments,
+    lists(path_segments, min_size=1, max_size=4),
 )
 
 positive_non_zero_integers = integers(min_value=1)
 
 
+DZI_WIDTHS = [43, 800, 1024, 4096, 9631, 100_000]
+DZI_HEIGHTS = [12, 600, 1024, 4096, 6247, 100_000]
+DZI_TILE_SIZES = [100, 256, 1024]
+
+
 @composite
 def dzi_metadata(
     draw,
-    widths=sampled_from([43, 800, 1024, 4096, 9631, 100_000]),
-    heights=sampled_from([12, 600, 1024, 4096, 6247, 100_000]),
-    tile_sizes=sampled_from([100, 256, 1024]),
+    widths=sampled_from(DZI_WIDTHS),
+    heights=sampled_from(DZI_HEIGHTS),
+    tile_sizes=sampled_from(DZI_TILE_SIZES),
     formats=sampled_from(["jpg", "png"]),
     overlaps=sampled_from([1, 0]),
 ):
@@ -68,31 +106,60 @@ def dzi_metadata(
     }
 
 
-@given(
-    dzi_path=fs_paths,
-    dzi_metadata=dzi_metadata(),
-    layer=integers(min_value=0, max_value=15),
-    tile_num=integers(min_value=0),
-)
-def test_get_dzi_tile_path(dzi_path, dzi_metadata, layer, tile_num):
+@lru_cache(maxsize=2048)
+def get_layer_tiles_cached(width, height, tile_size, scale_factor):
+    # Hypothesis draws the same few image shapes repeatedly, so only generate
+    # each shape's tiles once.
+    return tuple(
+        get_layer_tiles(
+            width=width, height=height, tile_size=tile_size, scale_factor=scale_factor
+        )
+    )
+
+
+def is_testable_layer(width, height, tile_size, layer):
+    return (
+        # 0 is the minimum DZI level
+        math.ceil(math.log2(max(width, height))) - layer >= 0
+        # Don't waste time testing cases with huge numbers of tiles
+        and (width / (2 ** layer) / tile_size) * (height / (2 ** layer) / tile_size)
+        < 2000
+    )
+
+
+# Filtering the layers up front means Hypothesis never generates examples that
+# have to be rejected.
+TESTABLE_DZI_LAYERS = [
+    (width, height, tile_size, layer)
+    for width in DZI_WIDTHS
+    for height in DZI_HEIGHTS
+    for tile_size in DZI_TILE_SIZES
+    for layer in range(16)
+    if is_testable_layer(width, height, tile_size, layer)
+]
+
+
+@composite
+def dzi_layers(draw, layers=sampled_from(TESTABLE_DZI_LAYERS)):
+    width, height, tile_size, layer = draw(layers)
+    metadata = draw(
+        dzi_metadata(
+            widths=just(width), heights=just(height), tile_sizes=just(tile_size)
+        )
+    )
+    return metadata, layer
+
+
+@given(dzi_path=fs_paths, dzi_layer=dzi_layers(), tile_num=integers(min_value=0))
+def test_get_dzi_tile_path(dzi_path, dzi_layer, tile_num):
+    dzi_metadata, layer = dzi_layer
     format = dzi_metadata["format"]
     width, height, tile_size = [
         dzi_metadata[k] for k in ["width", "height", "tile_size"]
     ]
-
     dzi_level = math.ceil(math.log2(max(width, height))) - layer
-    # 0 is the minimum DZI level
-    assume(dzi_level >= 0)
-    # Don't waste time testing cases with huge numbers of tiles
-    assume(
-        (width / (2 ** layer) / tile_size) * (height / (2 ** layer) / tile_size) < 2000
-    )
 
-    tiles = list(
-        get_layer_tiles(
-            width=width, height=height, tile_size=tile_size, scale_factor=2 ** layer
-        )
-    )
+    tiles = get_layer_tiles_cached(width, height, tile_size, 2 ** layer)
     tile = tiles[tile_num % len(tiles)]
 
     x, y = [tile["index"][k] for k in ["x", "y"]]
@@ -393,7 +393,10 @@ def test_load_config(full_dzi_config, expected):
 def test_ensure_mozjpeg_present_if_required(
     libjpeg_supports_params, libvips_supports_libjpeg_params, mozjpeg_option_used
 ):
-    jpeg_config = JPEGConfig(overshoot_deringing=mozjpeg_option_used)
+    jpeg_config = (
+        JPEGConfig(overshoot_deringing=True) if mozjpeg_option_used else JPEGConfig()
+    )
+    assert bool(jpeg_config.get_values_requiring_mozjpeg()) == mozjpeg_option_used
 
     mozjpeg_supported = libjpeg_supports_params and libvips_supports_libjpeg_params
 
@@ -413,6 +416,10 @@ def test_ensure_mozjpeg_present_if_required(
             except DZIGenerationError:
                 assert not mozjpeg_supported or not mozjpeg_option_used
 
+    if not mozjpeg_option_used:
+        _libjpeg_supports_params.assert_not_called()
+        _pyvips_supports_params.assert_not_called()
+
 
 def new_test_image(depth=8):
     """Create a 1x1 8 or 16 bit RGB image with all channels set to 0."""
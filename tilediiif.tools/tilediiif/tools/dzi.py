@@ -1,6 +1,7 @@
 import math
 import re
 import xml.etree.ElementTree as ET
+from io import BytesIO
 
 from tilediiif.tools.validation import (
     require_positive_int,
@@ -14,20 +15,52 @@ class DZIError(ValueError):
     pass
 
 
+DZI_IMAGE_TAG = "{http://schemas.microsoft.com/deepzoom/2008}Image"
+DZI_SIZE_TAG = "{http://schemas.microsoft.com/deepzoom/2008}Size"
+
+
 def parse_dzi_file(file):
-    return parse_dzi(ET.parse(file))
+    """
+    Parse the metadata of a .dzi file.
+
+    file can be a path, a binary file object or a bytes-like object holding
+    the file's contents. Parsing is incremental and stops once the Image
+    element's Size child has been seen, so the rest of the document is never
+    read or built.
+    """
+    if isinstance(file, (bytes, bytearray, memoryview)):
+        file = BytesIO(file)
+    image_el = size_el = None
+    depth = 0
+    for event, el in ET.iterparse(file, events=("start", "end")):
+        if event == "end":
+            depth -= 1
+            continue
+        depth += 1
+        if image_el is None:
+            image_el = el
+            _check_image_el(image_el)
+        elif depth == 2 and el.tag == DZI_SIZE_TAG:
+            size_el = el
+            break
+    return _parse_dzi_elements(image_el, size_el)
 
 
 def parse_dzi(xml_doc):
     image_el = xml_doc.getroot()
-    if image_el.tag != "{http://schemas.microsoft.com/deepzoom/2008}Image":
+    _check_image_el(image_el)
+    return _parse_dzi_elements(image_el, image_el.find(DZI_SIZE_TAG))
+
+
+def _check_image_el(image_el):
+    if image_el.tag != DZI_IMAGE_TAG:
         raise DZIError(
-            "Unexpected root element, expected:"
-            " {http://schemas.microsoft.com/deepzoom/2008}Image, but is:"
+            f"Unexpected root element, expected: {DZI_IMAGE_TAG}, but is:"
             f" {image_el.tag}"
         )
-    size_el = image_el.find("{http://schemas.microsoft.com/deepzoom/2008}Size")
 
+
+def _parse_dzi_elements(image_el, size_el):
     if size_el is None:
         raise DZIError(f"{image_el}")
 
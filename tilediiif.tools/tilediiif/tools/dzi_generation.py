@@ -145,11 +145,16 @@ class DescribedEnumMixin:
         self.label = label
         self.description = description
 
+    @classmethod
+    @lru_cache()
+    def members_by_label(cls):
+        return MappingProxyType({member.label: member for member in cls})
+
     @classmethod
     def for_label(cls, label):
         try:
-            return next(s for s in cls if s.label == label)
-        except StopIteration:
+            return cls.members_by_label()[label]
+        except (KeyError, TypeError):
             raise ValueError(f"{label!r} is not a valid {cls.__name__} label") from None
 
     @classmethod